@@ -1,6 +1,6 @@
 import datetime
 import functools
-import json
+import hashlib
 import socket
 import time
 import traceback
@@ -49,9 +49,18 @@ def DATE_MILLISECONDS(dt):
 
 
 def register(
-    url, methods=None, require_auth=True, custom_response=False, api_logging=True
+    url,
+    methods=None,
+    require_auth=True,
+    custom_response=False,
+    api_logging=True,
+    etag=False,
 ):
-    """Register an endpoint to be a data source."""
+    """Register an endpoint to be a data source.
+
+    If etag is True, successful responses carry an ETag so that clients
+    revalidate with If-None-Match and get an empty 304 when nothing changed.
+    """
 
     def wrapper(fn):
         @flask_app.route(r"%s%s" % (DS_PATH, url), methods=methods)
@@ -65,7 +74,8 @@ def register(
 
             params = {}
             if flask.request.method == "GET":
-                params = json.loads(flask.request.args.get("params", "{}"))
+                # Decode with the app's json provider (orjson)
+                params = flask.json.loads(flask.request.args.get("params", "{}"))
             elif flask.request.is_json:
                 params = flask.request.json
 
@@ -118,6 +128,16 @@ def register(
             else:
                 resp = flask.make_response(flask.jsonify(results), status)
                 resp.headers["Content-Type"] = "application/json"
+                if etag and status == OK_STATUS_CODE:
+                    resp.cache_control.private = True
+                    resp.cache_control.no_cache = True
+                    # Hash the payload without the host so that every web
+                    # host gives the same ETag for the same data
+                    payload = {k: v for k, v in results.items() if k != "host"}
+                    resp.set_etag(
+                        hashlib.sha1(flask.json.dumps(payload).encode()).hexdigest()
+                    )
+                    resp.make_conditional(flask.request)
                 return resp
 
         handler.__raw__ = fn
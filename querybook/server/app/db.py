@@ -29,6 +29,8 @@ def get_db_engine(
     conn_string=QuerybookSettings.DATABASE_CONN,
     pool_size=QuerybookSettings.DATABASE_POOL_SIZE,
     pool_recycle=QuerybookSettings.DATABASE_POOL_RECYCLE,
+    max_overflow=QuerybookSettings.DATABASE_POOL_MAX_OVERFLOW,
+    pool_timeout=QuerybookSettings.DATABASE_POOL_TIMEOUT,
 ):
     global __engine
     if not __engine:
@@ -39,6 +41,8 @@ def get_db_engine(
             conn_string,
             pool_size=pool_size,
             pool_recycle=pool_recycle,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
             pool_pre_ping=True,
             encoding="utf-8",
         )
@@ -79,6 +83,18 @@ def get_db_engine(
     return __engine
 
 
+def dispose_db_engine_pool():
+    """Drop the pooled connections inherited from the parent process.
+
+    Should be called right after a worker process is forked so that
+    each worker builds its own pool instead of sharing the sockets
+    opened by the parent. close=False leaves the parent's connections
+    untouched.
+    """
+    if __engine is not None:
+        __engine.dispose(close=False)
+
+
 def get_session(scopefunc=None):
     """Create a global bound scoped_session
 
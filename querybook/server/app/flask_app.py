@@ -3,7 +3,15 @@ import sys
 from datetime import timedelta
 
 from celery import Celery
-from flask import Flask, Blueprint, json as flask_json, has_request_context
+from flask import (
+    Flask,
+    Blueprint,
+    g,
+    json as flask_json,
+    has_request_context,
+    request,
+)
+from flask_login import current_user
 from flask_socketio import SocketIO
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
@@ -12,7 +20,7 @@ from flask_caching import Cache
 
 from const.path import BUILD_PATH, STATIC_PATH, WEBAPP_DIR_PATH
 from env import QuerybookSettings
-from lib.utils.json import JSONEncoder
+from lib.utils.json import ORJSONProvider
 
 
 def validate_db():
@@ -20,12 +28,16 @@ def validate_db():
     # before proceeding to other things such as
     # celery or flask server
     if not hasattr(sys, "_called_from_test"):
-        from app.db import get_db_engine
+        # Use a throwaway engine without pooling so that no connection
+        # gets created before gunicorn/celery fork the workers
+        from sqlalchemy import create_engine
+        from sqlalchemy.pool import NullPool
 
         try:
-            engine = get_db_engine()
+            engine = create_engine(QuerybookSettings.DATABASE_CONN, poolclass=NullPool)
             connection = engine.connect()
             connection.close()
+            engine.dispose()
         except Exception:
             raise Exception(
                 f"Invalid Database connection string {QuerybookSettings.DATABASE_CONN}"
@@ -34,8 +46,10 @@ def validate_db():
 
 def make_flask_app():
     app = Flask(__name__, static_folder=STATIC_PATH)
-    app.json_encoder = JSONEncoder
+    app.json = ORJSONProvider(app)
     app.secret_key = QuerybookSettings.FLASK_SECRET_KEY
+    # Match "/foo" to the "/foo/" rule directly instead of answering with a redirect
+    app.url_map.strict_slashes = False
 
     if QuerybookSettings.PRODUCTION:
         app.config.update(
@@ -52,26 +66,41 @@ def make_flask_app():
     if QuerybookSettings.TABLE_MAX_UPLOAD_SIZE is not None:
         app.config["MAX_CONTENT_LENGTH"] = int(QuerybookSettings.TABLE_MAX_UPLOAD_SIZE)
 
-    # Add Content-Security-Policy header to restrict iframe embedding to the allowed origins
-    csp_header_value = "frame-ancestors 'self' " + " ".join(
-        QuerybookSettings.IFRAME_ALLOWED_ORIGINS or []
-    )
-
-    @app.after_request
-    def add_csp_header(response):
-        response.headers["Content-Security-Policy"] = csp_header_value
-        return response
-
     return app
 
 
 def make_cache(app):
+    cache_config = dict(QuerybookSettings.FLASK_CACHE_CONFIG or {})
+    if cache_config.get("CACHE_TYPE") in ("redis", "RedisCache") and not (
+        cache_config.get("CACHE_REDIS_URL") or cache_config.get("CACHE_REDIS_HOST")
+    ):
+        if QuerybookSettings.REDIS_URL:
+            # Share the celery redis by default so that all processes see the same cache.
+            # RedisCache accepts a client as host, so reuse the process-wide connection pool
+            from clients.redis_client import get_redis
+
+            cache_config["CACHE_REDIS_HOST"] = get_redis()
+        else:
+            # No redis to point at (e.g. in tests), keep the cache in memory
+            # instead of silently connecting to localhost
+            cache_config["CACHE_TYPE"] = "SimpleCache"
+
     return Cache(
         app,
-        config=QuerybookSettings.FLASK_CACHE_CONFIG,
+        config=cache_config,
     )
 
 
+# Short-lived bookkeeping tasks that do not need a fresh process per task
+SHORT_CELERY_TASKS = [
+    "tasks.sync_elasticsearch.*",
+    "tasks.sync_es_queries_by_datadoc.*",
+    "tasks.log_query_per_table.*",
+    "tasks.delete_mysql_cache.*",
+    "tasks.poll_engine_status.*",
+]
+
+
 def make_celery(app):
     celery = Celery(
         app.import_name,
@@ -93,6 +122,15 @@ def make_celery(app):
         },
     )
 
+    if QuerybookSettings.CELERY_SHORT_TASK_QUEUE:
+        # Lets a separate worker consume the short tasks with a larger
+        # --prefetch-multiplier and --max-tasks-per-child, while the
+        # default queue keeps one process per task for query executions
+        celery.conf.task_routes = {
+            task_name: {"queue": QuerybookSettings.CELERY_SHORT_TASK_QUEUE}
+            for task_name in SHORT_CELERY_TASKS
+        }
+
     TaskBase = celery.Task
 
     class ContextTask(TaskBase):
@@ -113,34 +151,66 @@ def make_celery(app):
 
 def make_limiter(app):
     def limiter_key_func():
-        from flask_login import current_user
-
-        if hasattr(current_user, "id"):
-            return current_user.id
-        return get_remote_address()
+        # The key func runs once per applied limit, so compute it once per request
+        if "limiter_key" not in g:
+            g.limiter_key = (
+                current_user.id if hasattr(current_user, "id") else get_remote_address()
+            )
+        return g.limiter_key
 
     limiter = Limiter(
         app,
         key_func=limiter_key_func,
         default_limits=["60 per minute"],
         default_limits_per_method=True,
+        # Keep the counters in redis so that the limit is shared by all workers
+        storage_uri=QuerybookSettings.REDIS_URL,
+        # Own connections with a short connect timeout, rather than the shared
+        # redis pool which has none, so an unreachable redis fails fast and
+        # the in-memory fallback kicks in
+        storage_options={"socket_connect_timeout": 2},
+        # Keep serving requests with per process counters if redis is unreachable
+        in_memory_fallback_enabled=True,
     )
     limiter.enabled = QuerybookSettings.PRODUCTION
     for handler in app.logger.handlers:
         limiter.logger.addHandler(handler)
 
+    return limiter
+
+
+def make_response_headers(app, limiter):
+    # Add Content-Security-Policy header to restrict iframe embedding to the allowed origins
+    csp_header_value = "frame-ancestors 'self' " + " ".join(
+        QuerybookSettings.IFRAME_ALLOWED_ORIGINS or []
+    )
+
+    # Single callback for all the custom headers to avoid one dispatch per header
     @app.after_request
-    def limiter_add_headers(response):
-        if limiter.enabled and limiter.current_limit and limiter.current_limit.breached:
-            response.headers["flask-limit-amount"] = limiter.current_limit.limit.amount
-            response.headers["flask-limit-key"] = limiter.current_limit.key
-            response.headers["flask-limit-reset-at"] = limiter.current_limit.reset_at
-            response.headers["flask-limit-window-size"] = (
-                limiter.current_limit.limit.get_expiry()
-            )
-        return response
+    def add_response_headers(response):
+        # Nothing to add on a 304 as the client reuses the cached response.
+        # frame-ancestors only applies to documents, and static files are
+        # rate limit exempt, so skip the static files served by the app and
+        # its blueprints (e.g. webapp build files)
+        endpoint = request.endpoint
+        if response.status_code == 304 or (
+            endpoint is not None
+            and (endpoint == "static" or endpoint.endswith(".static"))
+        ):
+            return response
 
-    return limiter
+        response.headers["Content-Security-Policy"] = csp_header_value
+
+        if limiter.enabled:
+            current_limit = limiter.current_limit
+            if current_limit and current_limit.breached:
+                response.headers["flask-limit-amount"] = current_limit.limit.amount
+                response.headers["flask-limit-key"] = current_limit.key
+                response.headers["flask-limit-reset-at"] = current_limit.reset_at
+                response.headers["flask-limit-window-size"] = (
+                    current_limit.limit.get_expiry()
+                )
+        return response
 
 
 def make_socketio(app):
@@ -159,8 +229,10 @@ def make_socketio(app):
 
 
 def make_blue_print(app, limiter):
-    # Have flask automatically return the files within the build, so that it gzips them
-    # and handles its 200/304 logic.
+    # Have flask automatically return the files within the build, so that it
+    # handles its 200/304 logic. In production these are served (pre-gzipped) by
+    # uwsgi directly (see static-map in uwsgi.ini), so this is mostly used by the
+    # dev server, which compresses responses with flask_compress.
     blueprint = Blueprint(
         "static_build_files",
         __name__,
@@ -194,6 +266,7 @@ def make_static_plugin_blue_print(app, limiter):
 validate_db()
 flask_app = make_flask_app()
 limiter = make_limiter(flask_app)
+make_response_headers(flask_app, limiter)
 make_blue_print(flask_app, limiter)
 make_static_plugin_blue_print(flask_app, limiter)
 cache = make_cache(flask_app)
@@ -24,32 +24,33 @@ from . import python_cell
 
 # Keep this at the end of imports to make sure the plugin APIs override the default ones
 try:
-    import api_plugin
+    import api_plugin  # noqa: F401
 except ImportError:
     pass  # No api_plugin found
 
-# Flake8 :(
-admin
-dag_exporter
-datadoc
-impression
-metastore
-query_execution
-query_snippet
-query_engine
-search
-user
-schedule
-board
-utils
-table_upload
-tag
-event_log
-data_element
-comment
-survey
-query_transform
-api_plugin
-github
-query_review
-python_cell
+# All the datasource modules, their routes are registered on import
+ALL_DATASOURCES = (
+    admin,
+    dag_exporter,
+    datadoc,
+    impression,
+    metastore,
+    query_engine,
+    query_snippet,
+    query_execution,
+    search,
+    schedule,
+    user,
+    board,
+    utils,
+    table_upload,
+    tag,
+    event_log,
+    data_element,
+    comment,
+    survey,
+    query_transform,
+    github,
+    query_review,
+    python_cell,
+)
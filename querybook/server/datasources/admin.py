@@ -2,6 +2,7 @@ from flask_login import current_user
 
 from app.datasource import register, admin_only, api_assert
 from app.db import DBSession
+from app.flask_app import cache
 from const.admin import AdminOperation, AdminItemType
 from datasources.admin_audit_log import with_admin_audit_log
 from env import QuerybookSettings
@@ -24,12 +25,27 @@ from logic import demo as demo_logic
 from models.admin import Announcement, QueryMetastore, QueryEngine, AdminAuditLog
 
 
+# Announcements are read on every page load but rarely change, so the
+# listing is cached briefly and dropped on every update
+ANNOUNCEMENT_LIST_CACHE_TTL = 60
+
+
+@cache.memoize(ANNOUNCEMENT_LIST_CACHE_TTL)
+def _get_active_announcements():
+    with DBSession() as session:
+        return [
+            announcement.to_dict()
+            for announcement in logic.get_admin_announcements(session=session)
+        ]
+
+
 @register(
     "/announcement/",
     methods=["GET"],
+    etag=True,
 )
 def get_announcements():
-    return logic.get_admin_announcements()
+    return _get_active_announcements()
 
 
 # ADMIN ONLY APIs
@@ -70,6 +86,7 @@ def create_announcement(
         )
         announcement_dict = announcement.to_dict_admin()
 
+    cache.delete_memoized(_get_active_announcements)
     return announcement_dict
 
 
@@ -95,6 +112,8 @@ def update_announcement(id, **kwargs):
             session=session,
         )
         announcement_dict = announcement.to_dict_admin()
+
+    cache.delete_memoized(_get_active_announcements)
     return announcement_dict
 
 
@@ -103,18 +122,27 @@ def update_announcement(id, **kwargs):
 @with_admin_audit_log(AdminItemType.Announcement, AdminOperation.DELETE)
 def delete_announcement(id):
     Announcement.delete(id)
+    cache.delete_memoized(_get_active_announcements)
+
+
+# The executors, status checkers, metastore loaders, table upload exporters and
+# query validators are all loaded on import, so their listings can be built once
+query_engine_templates = get_flattened_executor_template()
+query_engine_status_checker_names = [
+    checker.NAME() for checker in ALL_ENGINE_STATUS_CHECKERS
+]
 
 
 @register("/admin/query_engine_template/", methods=["GET"])
 @admin_only
 def get_all_query_engines_templates():
-    return get_flattened_executor_template()
+    return query_engine_templates
 
 
 @register("/admin/query_engine_status_checker/", methods=["GET"])
 @admin_only
 def get_query_engine_status_checkers():
-    return [checker.NAME() for checker in ALL_ENGINE_STATUS_CHECKERS]
+    return query_engine_status_checker_names
 
 
 @register(
@@ -124,7 +152,7 @@ def get_query_engine_status_checkers():
 @admin_only
 def get_all_query_engines_admin():
     with DBSession() as session:
-        engines = QueryEngine.get_all(session=session)
+        engines = logic.get_all_query_engines(session=session)
         engines_dict = [engine.to_dict_admin() for engine in engines]
         return engines_dict
 
@@ -241,15 +269,18 @@ def recover_query_engine(
     logic.recover_query_engine_by_id(id)
 
 
+query_metastore_loaders = [
+    loader_class.serialize_loader_class() for loader_class in ALL_METASTORE_LOADERS
+]
+
+
 @register(
     "/admin/query_metastore_loader/",
     methods=["GET"],
 )
 @admin_only
 def get_all_query_metastore_loaders_admin():
-    return [
-        loader_class.serialize_loader_class() for loader_class in ALL_METASTORE_LOADERS
-    ]
+    return query_metastore_loaders
 
 
 @register(
@@ -263,8 +294,6 @@ def get_all_query_metastores_admin():
         metastores_dict = [metastore.to_dict_admin() for metastore in metastores]
         return metastores_dict
 
-    return []
-
 
 @register(
     "/admin/query_metastore/",
@@ -389,9 +418,9 @@ def delete_user_role(
     user_logic.delete_user_role(id)
 
 
-@register("/admin/environment/", methods=["GET"])
+@register("/admin/environment/", methods=["GET"], etag=True)
 def get_all_environments_admin():
-    return environment_logic.get_all_environment(include_deleted=True)
+    return environment_logic.get_all_environment_dicts()
 
 
 @register("/admin/environment/", methods=["POST"])
@@ -458,9 +487,10 @@ def get_users_in_environment(
     offset,
 ):
     with DBSession() as session:
-        return environment_logic.get_users_in_environment(
+        users = environment_logic.get_users_in_environment(
             id, offset, limit, session=session
         )
+        return [user.to_dict() for user in users]
 
 
 @register("/admin/environment/<int:id>/user/<int:uid>/", methods=["POST", "PUT"])
@@ -550,7 +580,7 @@ def exec_demo_set_up():
     return demo_logic.set_up_demo(current_user.id)
 
 
-admin_item_type_values = set(item.value for item in AdminItemType)
+admin_item_type_values = frozenset(item.value for item in AdminItemType)
 
 
 @register("/admin/audit_log/", methods=["GET"])
@@ -560,7 +590,12 @@ def get_admin_audit_logs(
     item_id=None,
     offset=0,
     limit=10,
+    before_id=None,
 ):
+    """
+    Returns the audit logs newest first. Pass the id of the last log received
+    as before_id to get the next page without an offset scan
+    """
     api_assert(limit < 200)
     api_assert(item_type is None or item_type in admin_item_type_values)
 
@@ -571,27 +606,40 @@ def get_admin_audit_logs(
         filters["item_id"] = item_id
 
     return AdminAuditLog.get_all(
-        **filters, limit=limit, offset=offset, order_by="id", desc=True
+        **filters,
+        limit=limit,
+        offset=offset,
+        order_by="id",
+        desc=True,
+        before_id=before_id,
     )
 
 
+# Settings do not change during the lifetime of the process
+querybook_config_dict = {
+    key: getattr(QuerybookSettings, key)
+    for key in dir(QuerybookSettings)
+    if not key.startswith("__")
+}
+
+
 @register("/admin/querybook_config/", methods=["GET"])
 @admin_only
 def get_admin_config():
-    return {
-        key: getattr(QuerybookSettings, key)
-        for key in dir(QuerybookSettings)
-        if not key.startswith("__")
-    }
+    return querybook_config_dict
+
+
+table_upload_exporter_names = list(ALL_TABLE_UPLOAD_EXPORTER_BY_NAME.keys())
+query_validators = list(ALL_QUERY_VALIDATORS_BY_NAME.values())
 
 
 @register("/admin/table_upload/exporter/", methods=["GET"])
 @admin_only
 def get_admin_table_upload_exporters():
-    return list(ALL_TABLE_UPLOAD_EXPORTER_BY_NAME.keys())
+    return table_upload_exporter_names
 
 
 @register("/admin/query_validator/", methods=["GET"])
 @admin_only
 def get_admin_query_validators():
-    return list(ALL_QUERY_VALIDATORS_BY_NAME.values())
+    return query_validators
@@ -1,6 +1,14 @@
 from app.flask_app import limiter
 from app.datasource import register
-from lib.change_log import get_change_log_list, get_change_log_content_by_date
+from lib.change_log import (
+    get_change_log_list,
+    get_change_log_content_by_date,
+    load_all_change_logs,
+)
+
+# Load the change logs at import time so that the uwsgi master reads
+# them once and the forked workers share the result
+load_all_change_logs()
 
 
 @register("/utils/change_logs/")
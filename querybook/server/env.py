@@ -62,6 +62,7 @@ class QuerybookSettings(object):
 
     # Celery
     REDIS_URL = get_env_config("REDIS_URL", optional=False)
+    CELERY_SHORT_TASK_QUEUE = get_env_config("CELERY_SHORT_TASK_QUEUE")
 
     # Search
     ELASTICSEARCH_HOST = get_env_config("ELASTICSEARCH_HOST", optional=False)
@@ -74,6 +75,8 @@ class QuerybookSettings(object):
     DATABASE_CONN = get_env_config("DATABASE_CONN", optional=False)
     DATABASE_POOL_SIZE = int(get_env_config("DATABASE_POOL_SIZE"))
     DATABASE_POOL_RECYCLE = int(get_env_config("DATABASE_POOL_RECYCLE"))
+    DATABASE_POOL_MAX_OVERFLOW = int(get_env_config("DATABASE_POOL_MAX_OVERFLOW"))
+    DATABASE_POOL_TIMEOUT = int(get_env_config("DATABASE_POOL_TIMEOUT"))
 
     # Communications
     EMAILER_CONN = get_env_config("EMAILER_CONN")
@@ -5,3 +5,10 @@ worker_class = "gevent"
 worker_connections = 1000
 
 timeout = 120
+
+
+def post_fork(server, worker):
+    # Make sure each worker builds its own database connection pool
+    from app.db import dispose_db_engine_pool
+
+    dispose_db_engine_pool()
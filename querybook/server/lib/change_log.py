@@ -1,10 +1,14 @@
 import os
-from itertools import islice
+from bisect import bisect_right
+from typing import List
 
 from const.path import CHANGE_LOG_PATH
 from env import QuerybookSettings
 
 __change_logs = None
+# Index of __change_logs by date and the dates in ascending order
+__change_logs_by_date = None
+__change_log_dates = None
 
 
 def generate_change_log(raw_text: str) -> str:
@@ -13,28 +17,30 @@ def generate_change_log(raw_text: str) -> str:
     return raw_text.replace("![](/changelog/", "![](/static/changelog/")
 
 
+def _scan_change_log_dir(path: str) -> List[os.DirEntry]:
+    # scandir returns the file type with each entry, no extra stat per file
+    with os.scandir(path) as entries:
+        return [entry for entry in entries if entry.is_file()]
+
+
 def load_all_change_logs():
     # Eventually there will be too many changelogs
     # TODO: add a maximum number of change logs to load
-    global __change_logs
+    global __change_logs, __change_logs_by_date, __change_log_dates
     if not __change_logs:
         change_logs = {}
-        change_log_files = os.listdir(CHANGE_LOG_PATH)
 
         change_log_plugin_path = os.path.join(
             QuerybookSettings.QUERYBOOK_PLUGIN_PATH, "./changelog_plugin/"
         )
 
-        plugin_change_log_files = []
+        # Plugin files come last so they override the main change log files
+        change_log_entries = _scan_change_log_dir(CHANGE_LOG_PATH)
         if os.path.exists(change_log_plugin_path):
-            plugin_change_log_files = os.listdir(change_log_plugin_path)
+            change_log_entries += _scan_change_log_dir(change_log_plugin_path)
 
-        # Merge the two lists of files and convert it to be a list of tuples (filename, from_plugin)
-        all_change_log_files = [(filename, False) for filename in change_log_files] + [
-            (filename, True) for filename in plugin_change_log_files
-        ]
-
-        for filename, from_plugin in all_change_log_files:
+        for entry in change_log_entries:
+            filename = entry.name
             if filename.startswith("breaking_change") or filename.startswith(
                 "security_advisories"
             ):
@@ -42,10 +48,7 @@ def load_all_change_logs():
                 # These are used for developer references when upgrading
                 continue
 
-            change_log_path = (
-                CHANGE_LOG_PATH if not from_plugin else change_log_plugin_path
-            )
-            with open(os.path.join(change_log_path, filename)) as f:
+            with open(entry.path) as f:
                 changelog_date = filename.split(".")[0]
                 # Plugin change log files will override the main change log files for the same date
                 change_logs[changelog_date] = {
@@ -57,23 +60,26 @@ def load_all_change_logs():
         __change_logs = sorted(
             change_logs.values(), key=lambda x: x["date"], reverse=True
         )
+        __change_logs_by_date = change_logs
+        __change_log_dates = sorted(change_logs.keys())
     return __change_logs
 
 
 def get_change_log_list(limit=None, date_after=None):
     change_logs = load_all_change_logs()
 
-    change_logs_list = []
-    for change_log in islice(change_logs, 0, limit):
-        if date_after is not None and change_log["date"] <= date_after:
-            break
-        change_logs_list.append(change_log)
-    return change_logs_list
+    end = len(change_logs)
+    if date_after is not None:
+        # Number of change logs strictly after date_after
+        end -= bisect_right(__change_log_dates, date_after)
+    if limit is not None:
+        end = min(end, limit)
+    return change_logs[:end]
 
 
 def get_change_log_content_by_date(date):
-    change_logs = load_all_change_logs()
+    load_all_change_logs()
 
-    for change_log in change_logs:
-        if change_log["date"] == date:
-            return change_log["content"]
+    change_log = __change_logs_by_date.get(date)
+    if change_log is not None:
+        return change_log["content"]
@@ -79,9 +79,20 @@ class CRUDMixin(SerializeMixin):
     @classmethod
     @with_session
     def get_all(
-        cls, session=None, limit=None, offset=None, order_by=None, desc=False, **kwargs
+        cls,
+        session=None,
+        limit=None,
+        offset=None,
+        order_by=None,
+        desc=False,
+        before_id=None,
+        **kwargs,
     ):
         query = cls._get_query(session=session, **kwargs)
+        if before_id is not None:
+            # Keyset pagination, seeks on the primary key instead of
+            # scanning and discarding offset rows
+            query = query.filter(cls.id < before_id)
         if order_by is not None:
             col = getattr(cls, order_by)
             if desc:
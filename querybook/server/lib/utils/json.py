@@ -1,7 +1,9 @@
 from datetime import datetime, date
 import json
 
+import orjson
 from flask import json as flask_json
+from flask.json.provider import DefaultJSONProvider
 from sqlalchemy.engine.row import Row
 
 from lib.utils.utils import DATE_TO_UTC, DATETIME_TO_UTC
@@ -31,6 +33,59 @@ class JSONEncoder(flask_json.JSONEncoder):
             return list(obj)
 
 
+_default_encoder = JSONEncoder()
+
+# Dates are passed through so that they get the same formatting as JSONEncoder
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_default(obj):
+    # json module serializes namedtuples as lists, keep it the same
+    if isinstance(obj, tuple):
+        return list(obj)
+    # orjson only serializes exact floats, json module handles the subclasses
+    # (e.g. numpy.float64) as floats
+    if isinstance(obj, float):
+        return float(obj)
+    return _default_encoder.default(obj)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson.
+
+    Falls back to the json module with JSONEncoder for custom dump arguments
+    (e.g. indent in debug mode) and for values orjson cannot serialize,
+    such as integers larger than 64 bits. Unlike the json module, NaN and
+    Infinity are serialized as null, which keeps the output valid JSON.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs.keys() <= {"separators"}:
+            option = ORJSON_OPTIONS
+            if self.sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            try:
+                return orjson.dumps(
+                    obj, default=_orjson_default, option=option
+                ).decode()
+            except orjson.JSONEncodeError:
+                pass
+
+        kwargs.setdefault("cls", JSONEncoder)
+        kwargs.setdefault("ensure_ascii", self.ensure_ascii)
+        kwargs.setdefault("sort_keys", self.sort_keys)
+        return json.dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if not kwargs:
+            try:
+                return orjson.loads(s)
+            except orjson.JSONDecodeError:
+                # json module is more lenient, e.g. it accepts NaN
+                pass
+        return json.loads(s, **kwargs)
+
+
 def dumps(*args, **kwargs):
     return json.dumps(cls=JSONEncoder, *args, *kwargs)
 
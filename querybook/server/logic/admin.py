@@ -3,6 +3,7 @@ import hashlib
 import uuid
 from sqlalchemy import func
 from sqlalchemy import or_
+from sqlalchemy.orm import defer, selectinload
 from datetime import date
 
 from app.db import with_session
@@ -40,7 +41,10 @@ def get_query_engines_by_ids(ids, session=None):
 
 @with_session
 def get_all_query_engines(session=None):
-    return session.query(QueryEngine).all()
+    # Load the environments of every engine in one extra query instead of one per engine
+    return (
+        session.query(QueryEngine).options(selectinload(QueryEngine.environments)).all()
+    )
 
 
 @with_session
@@ -50,6 +54,9 @@ def get_query_engines_by_environment(environment_id, ordered=False, session=None
         .join(QueryEngineEnvironment)
         .filter(QueryEngineEnvironment.environment_id == environment_id)
         .filter(QueryEngine.deleted_at.is_(None))
+        # Callers only need the ids or to_dict, which never exposes the
+        # connection details, so leave them to be loaded on access
+        .options(defer(QueryEngine.executor_params))
     )
 
     if ordered:
@@ -124,6 +124,7 @@ def set_up_demo(uid: int, session=None):
 
     if data_doc_id:
         session.commit()
+        environment_logic.clear_environment_list_cache()
 
         return {
             "environment": environment.name,
@@ -1,6 +1,8 @@
 from datetime import datetime
 from sqlalchemy import or_
+from sqlalchemy.orm import load_only
 from app.db import with_session
+from app.flask_app import cache
 
 # from lib.config import get_config_value
 from logic.user import get_user_by_id
@@ -20,7 +22,7 @@ def create_environment(
     commit=True,
     session=None,
 ):
-    return Environment.create(
+    environment = Environment.create(
         {
             "name": name,
             "description": description,
@@ -33,6 +35,9 @@ def create_environment(
         commit=commit,
         session=session,
     )
+    if commit:
+        clear_environment_list_cache()
+    return environment
 
 
 @with_session
@@ -93,15 +98,38 @@ def get_all_environment(include_deleted=False, session=None):
     return query.all()
 
 
+# The environment listing is read on every page load but rarely changes,
+# so it is cached briefly and dropped by every environment write below
+ENVIRONMENT_LIST_CACHE_TTL = 60
+
+
+@cache.memoize(ENVIRONMENT_LIST_CACHE_TTL)
+def get_all_environment_dicts():
+    return [
+        environment.to_dict()
+        for environment in get_all_environment(include_deleted=True)
+    ]
+
+
+def clear_environment_list_cache():
+    # Only clear after the write is committed, otherwise a read in between
+    # caches the old list again. Callers that pass commit=False must call
+    # this themselves after they commit.
+    cache.delete_memoized(get_all_environment_dicts)
+
+
 @with_session
 def update_environment(id, commit=True, session=None, **field_to_update):
-    return Environment.update(
+    environment = Environment.update(
         id,
         fields=field_to_update,
         field_names=["name", "description", "image", "public", "hidden", "shareable"],
         commit=commit,
         session=session,
     )
+    if commit:
+        clear_environment_list_cache()
+    return environment
 
 
 @with_session
@@ -115,6 +143,8 @@ def delete_environment_by_id(id, commit=True, session=None):
         else:
             session.flush()
         session.refresh(environment)
+        if commit:
+            clear_environment_list_cache()
 
 
 @with_session
@@ -128,6 +158,8 @@ def recover_environment_by_id(id, commit=True, session=None):
         else:
             session.flush()
         session.refresh(environment)
+        if commit:
+            clear_environment_list_cache()
 
 
 @with_session
@@ -136,6 +168,20 @@ def get_users_in_environment(environment_id, offset=0, limit=100, session=None):
         session.query(User)
         .join(UserEnvironment)
         .filter(UserEnvironment.environment_id == environment_id)
+        # Only the columns used by User.to_dict, skips the password hash
+        .options(
+            load_only(
+                User.id,
+                User.username,
+                User.fullname,
+                User.profile_img,
+                User.email,
+                User.deleted,
+                User.is_group,
+                User.properties,
+            )
+        )
+        .order_by(User.id)
         .offset(offset)
         .limit(limit)
         .all()
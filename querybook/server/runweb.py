@@ -17,6 +17,20 @@ import gevent.socket
 
 from app.server import flask_app
 
+try:
+    # Only available when running under uwsgi (prod_web)
+    from uwsgidecorators import postfork
+except ImportError:
+    pass
+else:
+
+    @postfork
+    def reset_worker_db_pool():
+        # Make sure each worker builds its own database connection pool
+        from app.db import dispose_db_engine_pool
+
+        dispose_db_engine_pool()
+
 
 def main():
     host = "0.0.0.0"
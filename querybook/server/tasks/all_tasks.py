@@ -1,7 +1,8 @@
-from celery.signals import celeryd_init, task_failure
+from celery.signals import celeryd_init, task_failure, worker_process_init
 from celery.utils.log import get_task_logger
 from importlib import import_module
 
+from app.db import dispose_db_engine_pool
 from app.flask_app import celery
 from env import QuerybookSettings
 from lib.logger import get_logger
@@ -58,6 +59,13 @@ def configure_workers(sender=None, conf=None, **kwargs):
         LOG.info(f"Starting DEV Celery worker: {sender}")
 
 
+@worker_process_init.connect
+def reset_worker_db_pool(**kwargs):
+    # The main worker process may have opened connections (e.g. in configure_workers)
+    # before forking, so each child process starts with a fresh pool
+    dispose_db_engine_pool()
+
+
 @task_failure.connect
 def handle_task_failure(sender, signal, *args, **kwargs):
     task_type = get_schedule_task_type(sender.name)
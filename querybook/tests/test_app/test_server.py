@@ -1,3 +1,4 @@
+import logging
 import os
 from app.server import get_health_check
 
@@ -24,3 +25,61 @@ def test_four_oh_four(flask_client, fake_user):
 
 def test_unauthed_error(flask_client):
     assert 401 == flask_client.get("/ds/some/random/path/").status_code
+
+
+def test_csp_header(flask_client):
+    assert "Content-Security-Policy" in flask_client.get("/ping/").headers
+    assert (
+        "Content-Security-Policy"
+        not in flask_client.get("/static/favicon/querybook.svg").headers
+    )
+
+
+def test_no_trailing_slash_redirect(flask_client):
+    assert b"pong" == flask_client.get("/ping").get_data()
+
+
+def test_announcement_etag(flask_client, fake_user):
+    resp = flask_client.get("/ds/announcement/")
+    assert 200 == resp.status_code
+    assert resp.headers["ETag"]
+
+    resp = flask_client.get(
+        "/ds/announcement/", headers={"If-None-Match": resp.headers["ETag"]}
+    )
+    assert 304 == resp.status_code
+    assert b"" == resp.get_data()
+
+
+def test_announcement_etag_across_hosts(flask_client, fake_user, monkeypatch):
+    from app import datasource
+
+    monkeypatch.setattr(datasource, "_host", "web-1")
+    etag = flask_client.get("/ds/announcement/").headers["ETag"]
+
+    # Revalidating against another web host still gets a 304
+    monkeypatch.setattr(datasource, "_host", "web-2")
+    resp = flask_client.get("/ds/announcement/", headers={"If-None-Match": etag})
+    assert 304 == resp.status_code
+
+
+def test_limiter_storage_failure(monkeypatch, caplog):
+    from flask import Flask
+    from app.flask_app import make_limiter
+    from env import QuerybookSettings
+
+    # Nothing listens on port 1, so every call to the storage fails
+    monkeypatch.setattr(QuerybookSettings, "REDIS_URL", "redis://127.0.0.1:1/0")
+    app = Flask(__name__)
+    limiter = make_limiter(app)
+    limiter.enabled = True
+
+    @app.route("/limited/")
+    def limited():
+        return "ok"
+
+    with caplog.at_level(logging.WARNING, logger=limiter.logger.name):
+        resp = app.test_client().get("/limited/")
+
+    assert 200 == resp.status_code
+    assert "falling back to in-memory storage" in caplog.text
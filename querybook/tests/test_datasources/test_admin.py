@@ -0,0 +1,82 @@
+from sqlalchemy.orm import Session
+
+import datasources  # noqa: F401 registers the routes
+from logic import environment as environment_logic
+
+
+def _get_data(flask_client, url):
+    resp = flask_client.get(url)
+    assert 200 == resp.status_code
+    return resp.get_json()["data"]
+
+
+def test_announcement_cache_invalidation(flask_client, fake_user):
+    # current_user is what the patched _get_user returns
+    fake_user.return_value.id = 1
+    before = _get_data(flask_client, "/ds/announcement/")
+
+    created = flask_client.post(
+        "/ds/admin/announcement/", json={"message": "cached announcement"}
+    ).get_json()["data"]
+    announcements = _get_data(flask_client, "/ds/announcement/")
+    assert len(announcements) == len(before) + 1
+    assert created["id"] in [a["id"] for a in announcements]
+
+    flask_client.put(
+        "/ds/admin/announcement/{}/".format(created["id"]),
+        json={"message": "updated announcement"},
+    )
+    announcements = _get_data(flask_client, "/ds/announcement/")
+    assert "updated announcement" in [a["message"] for a in announcements]
+
+    flask_client.delete("/ds/admin/announcement/{}/".format(created["id"]))
+    announcements = _get_data(flask_client, "/ds/announcement/")
+    assert created["id"] not in [a["id"] for a in announcements]
+
+
+def test_environment_cache_invalidation(flask_client, fake_user):
+    _get_data(flask_client, "/ds/admin/environment/")
+
+    # Created outside of the admin handlers, like the demo set up does
+    environment = environment_logic.create_environment(name="cached_environment")
+    environments = _get_data(flask_client, "/ds/admin/environment/")
+    assert "cached_environment" in [e["name"] for e in environments]
+
+    environment_logic.delete_environment_by_id(environment.id)
+    environments = _get_data(flask_client, "/ds/admin/environment/")
+    assert [
+        e["deleted_at"] for e in environments if e["name"] == "cached_environment"
+    ] != [None]
+
+
+def _get_environment_names(flask_client):
+    return [e["name"] for e in _get_data(flask_client, "/ds/admin/environment/")]
+
+
+def test_environment_cache_invalidation_without_commit(
+    flask_client, fake_user, db_engine, monkeypatch
+):
+    cache = environment_logic.cache
+    delete_memoized = cache.delete_memoized
+    cleared = []
+
+    def spy_delete_memoized(*args, **kwargs):
+        cleared.append(args)
+        return delete_memoized(*args, **kwargs)
+
+    monkeypatch.setattr(cache, "delete_memoized", spy_delete_memoized)
+    _get_environment_names(flask_client)
+
+    # With commit=False the cache is left alone until the caller commits,
+    # a read in between would otherwise cache the old list again
+    session = Session(bind=db_engine)
+    environment_logic.create_environment(
+        name="uncommitted_environment", commit=False, session=session
+    )
+    assert cleared == []
+    assert "uncommitted_environment" not in _get_environment_names(flask_client)
+
+    session.commit()
+    session.close()
+    environment_logic.clear_environment_list_cache()
+    assert "uncommitted_environment" in _get_environment_names(flask_client)
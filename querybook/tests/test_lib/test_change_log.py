@@ -0,0 +1,24 @@
+from lib.change_log import (
+    get_change_log_content_by_date,
+    get_change_log_list,
+    load_all_change_logs,
+)
+
+
+def test_get_change_log_list():
+    change_logs = load_all_change_logs()
+    dates = [change_log["date"] for change_log in change_logs]
+    assert dates == sorted(dates, reverse=True)
+
+    assert get_change_log_list() == change_logs
+    assert get_change_log_list(limit=1) == change_logs[:1]
+    assert get_change_log_list(date_after=dates[0]) == []
+    assert get_change_log_list(date_after=dates[-1]) == change_logs[:-1]
+    assert get_change_log_list(date_after="0000-00-00") == change_logs
+    assert get_change_log_list(limit=1, date_after=dates[-1]) == change_logs[:1]
+
+
+def test_get_change_log_content_by_date():
+    change_log = load_all_change_logs()[0]
+    assert get_change_log_content_by_date(change_log["date"]) == change_log["content"]
+    assert get_change_log_content_by_date("0000-00-00") is None
@@ -0,0 +1,24 @@
+from const.admin import AdminOperation
+from models.admin import AdminAuditLog
+
+
+def test_get_all_before_id(db_engine):
+    ids = [
+        AdminAuditLog.create(
+            {"item_type": "keyset_test", "item_id": i, "op": AdminOperation.CREATE}
+        ).id
+        for i in range(5)
+    ]
+
+    def get_ids(**kwargs):
+        return [
+            log.id
+            for log in AdminAuditLog.get_all(
+                item_type="keyset_test", order_by="id", desc=True, **kwargs
+            )
+        ]
+
+    assert get_ids() == ids[::-1]
+    assert get_ids(limit=2, before_id=ids[3]) == [ids[2], ids[1]]
+    assert get_ids(limit=2, before_id=ids[0]) == []
+    assert get_ids(limit=2, offset=1, before_id=ids[4]) == [ids[2], ids[1]]
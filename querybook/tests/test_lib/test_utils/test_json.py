@@ -0,0 +1,44 @@
+import json
+import math
+from collections import namedtuple
+from datetime import date, datetime
+
+import numpy as np
+from flask import Flask
+
+from lib.utils.json import JSONEncoder, ORJSONProvider
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+def _stdlib_dumps(obj):
+    return json.dumps(obj, cls=JSONEncoder, sort_keys=True)
+
+
+def test_orjson_provider_matches_json_encoder():
+    provider = ORJSONProvider(Flask(__name__))
+    obj = {
+        "b": [1, 2.5, None, True, "é"],
+        "a": {"created_at": datetime(2020, 1, 1, 12), "day": date(2020, 1, 2)},
+        "point": Point(1, 2),
+        "ids": {1: "int key", 2: "another"},
+        "numpy": [np.float64(1.5), np.float32(0.5)],
+    }
+
+    assert json.loads(provider.dumps(obj)) == json.loads(_stdlib_dumps(obj))
+
+
+def test_orjson_provider_nan():
+    provider = ORJSONProvider(Flask(__name__))
+    # NaN is not valid JSON, orjson writes null where the json module wrote NaN
+    assert provider.dumps({"value": float("nan")}) == '{"value":null}'
+
+
+def test_orjson_provider_fallback():
+    provider = ORJSONProvider(Flask(__name__))
+    big_int = {"value": 2**70}
+
+    assert provider.dumps(big_int) == _stdlib_dumps(big_int)
+    assert provider.dumps([1, 2], indent=2) == json.dumps([1, 2], indent=2)
+    assert math.isnan(provider.loads('{"value": NaN}')["value"])
+    assert provider.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}